@@ -0,0 +1,118 @@
+"""
+Event loop responsiveness benchmark for the derived metrics endpoint
+
+Runs the app in-process over httpx's ASGI transport, keeps /derived busy
+with large batches and meanwhile times /health, once per compute executor.
+Reports /health latency and LoopLagMonitor statistics for each mode:
+
+    python -m api.benchmark --cities 1000 --duration 5
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+import httpx
+
+from api.main import app
+from api.services.compute_service import EXECUTOR_KINDS, compute_service
+from api.services.loop_monitor import loop_monitor, percentile
+from api.services.weather_service import weather_service
+
+async def run_mode(mode: str, cities: int, history_days: int, concurrency: int,
+                   duration: float, probe_interval: float) -> Dict[str, float]:
+    """
+    Benchmark one executor mode
+
+    Args:
+        mode: "idle" for no /derived load, otherwise a COMPUTE_EXECUTOR value
+        cities: Number of cities per /derived request
+        history_days: Days of history per city
+        concurrency: Number of concurrent /derived clients
+        duration: Seconds to run the load
+        probe_interval: Seconds between /health probes
+
+    Returns:
+        Dictionary of results
+    """
+    compute_service.shutdown()
+    compute_service.executor_kind = "inline" if mode == "idle" else mode
+    names = list(weather_service.mock_data)
+    payload = {
+        "cities": [names[i % len(names)] for i in range(cities)],
+        "history_days": history_days,
+        "smoothing_window": 7
+    }
+
+    latencies: List[float] = []
+    derived = {"requests": 0, "chunks": 0}
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            deadline = time.perf_counter() + duration
+
+            async def load():
+                while time.perf_counter() < deadline:
+                    response = await client.post("/api/v1/derived", json=payload)
+                    response.raise_for_status()
+                    derived["requests"] += 1
+                    derived["chunks"] += len(response.text.splitlines())
+
+            async def probe():
+                while time.perf_counter() < deadline:
+                    # Measure from when the probe was due, so time spent
+                    # waiting for a blocked loop counts as latency
+                    due = time.perf_counter() + probe_interval
+                    await asyncio.sleep(probe_interval)
+                    response = await client.get("/api/v1/health")
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - due)
+
+            # Startup (pool warm-up) lag is not part of the measurement
+            loop_monitor.reset()
+            loaders = [] if mode == "idle" else [load() for _ in range(concurrency)]
+            await asyncio.gather(probe(), *loaders)
+            lag = loop_monitor.snapshot()
+
+    return {
+        "derived_req": derived["requests"],
+        "derived_chunks": derived["chunks"],
+        "health_probes": len(latencies),
+        "health_p50_ms": percentile(latencies, 0.50) * 1000,
+        "health_p99_ms": percentile(latencies, 0.99) * 1000,
+        "health_max_ms": max(latencies, default=0.0) * 1000,
+        "lag_mean_ms": lag["mean_ms"],
+        "lag_p99_ms": lag["p99_ms"],
+        "lag_max_ms": lag["max_ms"]
+    }
+
+def main():
+    """Parse arguments and print benchmark results"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--modes', nargs='+', default=['idle', *EXECUTOR_KINDS[::-1]],
+                        choices=['idle', *EXECUTOR_KINDS])
+    parser.add_argument('--cities', type=int, default=1000)
+    parser.add_argument('--history-days', type=int, default=365)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--probe-interval', type=float, default=0.02)
+    args = parser.parse_args()
+
+    print(f"{args.cities} cities x {args.history_days} days, "
+          f"{args.concurrency} concurrent /derived clients, {args.duration:.0f}s per mode")
+    rows = {}
+    for mode in args.modes:
+        rows[mode] = asyncio.run(run_mode(mode, args.cities, args.history_days, args.concurrency,
+                                          args.duration, args.probe_interval))
+
+    columns = list(next(iter(rows.values())))
+    print(f"{'mode':>8} " + " ".join(f"{name:>14}" for name in columns))
+    for mode, results in rows.items():
+        print(f"{mode:>8} " + " ".join(
+            f"{value:>14.2f}" if isinstance(value, float) else f"{value:>14}" for value in results.values()
+        ))
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,37 @@ FastAPI application main module
 """
 
 import uvicorn
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from datetime import datetime
+from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse
 
+from api.models.weather import ErrorResponse
 from api.routes.weather import router as weather_router
+from api.services.compute_service import compute_service
+from api.services.loop_monitor import loop_monitor
 from config.settings import settings
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background services and warm up the worker pool; stop them on shutdown"""
+    loop_monitor.start()
+    await compute_service.start()
+    try:
+        yield
+    finally:
+        await loop_monitor.stop()
+        compute_service.shutdown()
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="A modern weather API built with FastAPI",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -31,6 +48,31 @@ app.add_middleware(
 # Include routers
 app.include_router(weather_router)
 
+# Error handlers
+@app.exception_handler(HTTPException)
+async def http_exception_handler(request, exc: HTTPException):
+    """Custom HTTP exception handler"""
+    return JSONResponse(
+        status_code=exc.status_code,
+        content=ErrorResponse(
+            error=exc.detail,
+            detail=f"HTTP {exc.status_code}",
+            timestamp=datetime.now().isoformat()
+        ).dict()
+    )
+
+@app.exception_handler(Exception)
+async def general_exception_handler(request, exc: Exception):
+    """General exception handler"""
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content=ErrorResponse(
+            error="Internal server error",
+            detail=str(exc),
+            timestamp=datetime.now().isoformat()
+        ).dict()
+    )
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -3,7 +3,7 @@ Pydantic models for weather data
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class WeatherRequest(BaseModel):
@@ -78,4 +78,42 @@ class HealthResponse(BaseModel):
                 "timestamp": "2024-01-15T14:30:00",
                 "version": "1.0.0"
             }
-        }
\ No newline at end of file
+        }
+
+class DerivedMetricsRequest(BaseModel):
+    """Derived metrics request model"""
+    cities: List[str] = Field(..., min_length=1, max_length=1000, description="City names")
+    country: str = Field(default="US", min_length=2, max_length=5, description="Country code")
+    history_days: int = Field(default=14, ge=1, le=365, description="Days of history to smooth over")
+    smoothing_window: int = Field(default=3, ge=1, le=30, description="Moving average window in days")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "cities": ["New York", "London", "Tokyo"],
+                "country": "US",
+                "history_days": 14,
+                "smoothing_window": 3
+            }
+        }
+
+class DerivedMetrics(BaseModel):
+    """Derived metrics for a single city"""
+    city: str = Field(..., description="City name")
+    country: str = Field(..., description="Country code")
+    heat_index: float = Field(..., description="Heat index in Celsius")
+    dew_point: float = Field(..., description="Dew point in Celsius")
+    comfort_score: float = Field(..., ge=0, le=100, description="Comfort score (0-100)")
+    smoothed_forecast: List[float] = Field(..., description="Smoothed daily temperatures in Celsius")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "city": "New York",
+                "country": "US",
+                "heat_index": 22.8,
+                "dew_point": 15.6,
+                "comfort_score": 86.4,
+                "smoothed_forecast": [22.1, 22.4, 22.9],
+            }
+        }
@@ -3,11 +3,14 @@ Weather API routes
 """
 
 from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
 from datetime import datetime
+import json
 
-from api.models.weather import WeatherRequest, WeatherResponse, ErrorResponse, HealthResponse
+from api.models.weather import WeatherRequest, WeatherResponse, ErrorResponse, HealthResponse, DerivedMetricsRequest
 from api.services.weather_service import weather_service
+from api.services.compute_service import compute_service
+from api.services.loop_monitor import loop_monitor
 from config.settings import settings
 
 # Create router
@@ -31,6 +34,8 @@ async def root():
             "health": "/health",
             "weather": "/weather",
             "cities": "/cities",
+            "derived": "/derived",
+            "loop_lag": "/metrics/loop-lag",
             "docs": "/docs"
         },
         "timestamp": datetime.now().isoformat()
@@ -93,27 +98,52 @@ async def get_weather_by_city(city: str, country: str = "US"):
     request = WeatherRequest(city=city, country=country)
     return await get_weather(request)
 
-# Error handlers
-@router.exception_handler(HTTPException)
-async def http_exception_handler(request, exc: HTTPException):
-    """Custom HTTP exception handler"""
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=ErrorResponse(
-            error=exc.detail,
-            detail=f"HTTP {exc.status_code}",
-            timestamp=datetime.now().isoformat()
-        ).dict()
-    )
+@router.post("/derived")
+async def get_derived_metrics(request: DerivedMetricsRequest):
+    """
+    Get derived metrics for a batch of cities, streamed as NDJSON
+    
+    - **cities**: City names (required)
+    - **country**: Country code echoed in the results (optional, defaults to US)
+    - **history_days**: Days of temperature history to smooth over
+    - **smoothing_window**: Moving average window in days
+    
+    Computation runs in a worker pool so other routes stay responsive.
+    Each line is one chunk: {"chunk": n, "results": [...]}
+    If a chunk fails, the last line is an ErrorResponse object instead.
+    """
+    # Resolve cities up front so unknown names still get a proper 404
+    readings = [weather_service.get_readings(city) for city in request.cities]
+    history = [weather_service.get_temperature_history(city, request.history_days) for city in request.cities]
+    
+    async def stream():
+        chunk = 0
+        try:
+            async for line in compute_service.stream_derived(
+                request.cities, request.country.upper(), readings, history, request.smoothing_window
+            ):
+                yield line
+                chunk += 1
+        except Exception as e:
+            # Headers are already sent, so report the failure in-band
+            yield json.dumps(ErrorResponse(
+                error="Derived metrics computation failed",
+                detail=f"Chunk {chunk}: {type(e).__name__}: {str(e)}",
+                timestamp=datetime.now().isoformat()
+            ).dict()) + "\n"
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
 
-@router.exception_handler(Exception)
-async def general_exception_handler(request, exc: Exception):
-    """General exception handler"""
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=ErrorResponse(
-            error="Internal server error",
-            detail=str(exc),
-            timestamp=datetime.now().isoformat()
-        ).dict()
-    )
\ No newline at end of file
+@router.get("/metrics/loop-lag")
+async def get_loop_lag(reset: bool = False):
+    """
+    Get event loop lag statistics
+    
+    - **reset**: Clear collected samples after reading (query parameter)
+    
+    Compare before/after a /derived run to check the loop stays responsive.
+    """
+    stats = loop_monitor.snapshot()
+    if reset:
+        loop_monitor.reset()
+    return {**stats, "timestamp": datetime.now().isoformat()}
\ No newline at end of file
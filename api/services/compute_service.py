@@ -0,0 +1,274 @@
+"""
+Compute service for CPU-heavy derived weather metrics
+"""
+
+import asyncio
+import json
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import numpy as np
+
+from config.settings import settings
+
+# Supported values for COMPUTE_EXECUTOR
+EXECUTOR_KINDS = ("process", "thread", "inline")
+
+# Ideal conditions used by the comfort score
+COMFORT_TEMPERATURE = 21.0
+COMFORT_HUMIDITY = 45.0
+
+def dew_point(temperature: np.ndarray, humidity: np.ndarray) -> np.ndarray:
+    """
+    Dew point using the Magnus approximation
+
+    Args:
+        temperature: Temperatures in Celsius
+        humidity: Relative humidity percentages
+
+    Returns:
+        Dew points in Celsius
+    """
+    a, b = 17.62, 243.12
+    gamma = np.log(np.clip(humidity, 1.0, 100.0) / 100.0) + a * temperature / (b + temperature)
+    return b * gamma / (a - gamma)
+
+def heat_index(temperature: np.ndarray, humidity: np.ndarray) -> np.ndarray:
+    """
+    Heat index using the NWS Rothfusz regression
+
+    Args:
+        temperature: Temperatures in Celsius
+        humidity: Relative humidity percentages
+
+    Returns:
+        Heat index in Celsius
+    """
+    t = temperature * 9.0 / 5.0 + 32.0
+    rh = humidity
+    simple = 0.5 * (t + 61.0 + (t - 68.0) * 1.2 + rh * 0.094)
+    full = (-42.379 + 2.04901523 * t + 10.14333127 * rh
+            - 0.22475541 * t * rh - 0.00683783 * t * t
+            - 0.05481717 * rh * rh + 0.00122874 * t * t * rh
+            + 0.00085282 * t * rh * rh - 0.00000199 * t * t * rh * rh)
+    hi = np.where((simple + t) / 2.0 >= 80.0, full, simple)
+    return (hi - 32.0) * 5.0 / 9.0
+
+def comfort_score(temperature: np.ndarray, humidity: np.ndarray, wind_speed: np.ndarray) -> np.ndarray:
+    """
+    Comfort score from 0 (unbearable) to 100 (ideal)
+
+    Args:
+        temperature: Temperatures in Celsius
+        humidity: Relative humidity percentages
+        wind_speed: Wind speeds in km/h
+
+    Returns:
+        Comfort scores
+    """
+    penalty = (3.0 * np.abs(temperature - COMFORT_TEMPERATURE)
+               + 0.5 * np.abs(humidity - COMFORT_HUMIDITY)
+               + 0.4 * np.maximum(wind_speed - 20.0, 0.0))
+    return np.clip(100.0 - penalty, 0.0, 100.0)
+
+def smooth_history(history: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing moving average over each row of a history matrix
+
+    Args:
+        history: Matrix of shape (cities, days)
+        window: Window size in days
+
+    Returns:
+        Matrix of shape (cities, days - window + 1)
+    """
+    window = min(window, history.shape[1])
+    cumsum = np.cumsum(history, axis=1)
+    cumsum = np.concatenate([np.zeros((history.shape[0], 1)), cumsum], axis=1)
+    return (cumsum[:, window:] - cumsum[:, :-window]) / window
+
+def compute_chunk(
+    temperature: List[float],
+    humidity: List[float],
+    wind_speed: List[float],
+    history: List[List[float]],
+    window: int
+) -> Dict[str, List[Any]]:
+    """
+    Compute all derived metrics for a batch of cities
+
+    Runs inside a worker, so it only takes and returns picklable data.
+
+    Returns:
+        Dictionary of per-city metric lists
+    """
+    t = np.asarray(temperature, dtype=np.float64)
+    rh = np.asarray(humidity, dtype=np.float64)
+    ws = np.asarray(wind_speed, dtype=np.float64)
+    return {
+        "heat_index": np.round(heat_index(t, rh), 1).tolist(),
+        "dew_point": np.round(dew_point(t, rh), 1).tolist(),
+        "comfort_score": np.round(comfort_score(t, rh, ws), 1).tolist(),
+        "smoothed_forecast": np.round(smooth_history(np.asarray(history, dtype=np.float64), window), 1).tolist(),
+    }
+
+def render_chunk(
+    index: int,
+    cities: List[str],
+    country: str,
+    temperature: List[float],
+    humidity: List[float],
+    wind_speed: List[float],
+    history: List[List[float]],
+    window: int
+) -> str:
+    """
+    Compute a batch of cities and serialize it as one NDJSON line
+
+    Serializing in the worker keeps the (large) JSON encoding off the
+    event loop as well. Results are plain dicts shaped like DerivedMetrics:
+    validating every 365-float list through pydantic would cost several
+    times more than the computation itself.
+
+    Returns:
+        '{"chunk": index, "results": [DerivedMetrics, ...]}' plus newline
+    """
+    result = compute_chunk(temperature, humidity, wind_speed, history, window)
+    results = [
+        {
+            "city": city.title(),
+            "country": country,
+            "heat_index": result["heat_index"][i],
+            "dew_point": result["dew_point"][i],
+            "comfort_score": result["comfort_score"][i],
+            "smoothed_forecast": result["smoothed_forecast"][i],
+        }
+        for i, city in enumerate(cities)
+    ]
+    return json.dumps({"chunk": index, "results": results}) + "\n"
+
+class ComputeService:
+    """Service for running derived metric computations off the event loop"""
+
+    def __init__(self, executor: str = "process", workers: int = 2, chunk_size: int = 64):
+        # "process" runs whole chunks off the GIL; "thread" only overlaps the
+        # NumPy math, JSON encoding still holds the GIL and competes with the
+        # loop; "inline" runs on the event loop (baseline only)
+        if executor not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown compute executor '{executor}'. Use one of: {', '.join(EXECUTOR_KINDS)}")
+        self.executor_kind = executor
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._executor: Optional[Executor] = None
+
+    def _create_executor(self) -> Optional[Executor]:
+        """Create the worker pool for the configured executor kind"""
+        if self.executor_kind == "thread":
+            return ThreadPoolExecutor(max_workers=self.workers)
+        if self.executor_kind == "process":
+            # Never fork a process that has a running event loop and threads
+            return ProcessPoolExecutor(max_workers=self.workers,
+                                       mp_context=multiprocessing.get_context("spawn"))
+        return None
+
+    def _get_executor(self) -> Optional[Executor]:
+        """Get the worker pool, creating it if start() was not called"""
+        if self._executor is None:
+            self._executor = self._create_executor()
+        return self._executor
+
+    async def start(self):
+        """
+        Create the worker pool and start every worker
+
+        Called from the app startup hook so no request pays for spawning
+        workers on the event loop thread.
+        """
+        if self.executor_kind == "inline" or self._executor is not None:
+            return
+        loop = asyncio.get_running_loop()
+        executor = await loop.run_in_executor(None, self._create_executor)
+        # One small job per worker spawns them all and imports NumPy in each
+        await asyncio.gather(*(
+            loop.run_in_executor(executor, render_chunk, 0, ["warm-up"], "US", [20.0], [50.0], [5.0], [[20.0]], 1)
+            for _ in range(self.workers)
+        ))
+        self._executor = executor
+
+    async def stream_derived(
+        self,
+        cities: List[str],
+        country: str,
+        readings: List[Dict[str, Any]],
+        history: List[List[float]],
+        window: int
+    ) -> AsyncIterator[str]:
+        """
+        Compute derived metrics in chunks, yielding each chunk in order
+
+        Args:
+            cities: City names
+            country: Country code, echoed in every result
+            readings: Current readings for each city
+            history: Daily temperature history for each city
+            window: Moving average window in days
+
+        Yields:
+            NDJSON lines as built by render_chunk, one per chunk
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+
+        # Submit every chunk up front so workers stay busy while we stream
+        pending = []
+        for index, start in enumerate(range(0, len(cities), self.chunk_size)):
+            end = start + self.chunk_size
+            batch = readings[start:end]
+            args = (
+                index,
+                cities[start:end],
+                country,
+                [r["temperature"] for r in batch],
+                [r["humidity"] for r in batch],
+                [r["wind_speed"] for r in batch],
+                history[start:end],
+                window,
+            )
+            future = loop.run_in_executor(executor, render_chunk, *args) if executor else None
+            pending.append((args, future))
+
+        try:
+            for args, future in pending:
+                try:
+                    line = await future if future else render_chunk(*args)
+                except BrokenProcessPool:
+                    # A dead worker poisons the pool: start fresh next request
+                    self.shutdown()
+                    raise
+                yield line
+        finally:
+            # Client went away or a chunk failed: don't leave queued chunks
+            # behind, and retrieve errors of finished ones so none go unlogged
+            for _, future in pending:
+                if future is None:
+                    continue
+                if future.done():
+                    if not future.cancelled():
+                        future.exception()
+                else:
+                    future.cancel()
+
+    def shutdown(self):
+        """Shut down the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+# Create global compute service instance
+compute_service = ComputeService(
+    executor=settings.COMPUTE_EXECUTOR,
+    workers=settings.COMPUTE_WORKERS,
+    chunk_size=settings.COMPUTE_CHUNK_SIZE
+)
@@ -0,0 +1,78 @@
+"""
+Event loop lag monitor
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Sequence
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile
+
+    Args:
+        values: Samples, in any order
+        pct: Percentile as a fraction, e.g. 0.99
+
+    Returns:
+        The percentile value, or 0.0 if there are no samples
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * pct), len(ordered) - 1)]
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes up from a fixed-interval sleep"""
+
+    def __init__(self, interval: float = 0.05, samples: int = 1200):
+        self.interval = interval
+        self._lags: Deque[float] = deque(maxlen=samples)
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        """Sample loop lag until cancelled"""
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self._lags.append(max(time.perf_counter() - start - self.interval, 0.0))
+
+    def start(self):
+        """Start sampling on the running event loop"""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop sampling"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def reset(self):
+        """Discard collected samples"""
+        self._lags.clear()
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Get lag statistics over the collected samples
+
+        Returns:
+            Dictionary with sample count and mean/p99/max lag in milliseconds
+        """
+        lags = list(self._lags)
+        if not lags:
+            return {"samples": 0, "mean_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        return {
+            "samples": len(lags),
+            "mean_ms": round(sum(lags) / len(lags) * 1000, 2),
+            "p99_ms": round(percentile(lags, 0.99) * 1000, 2),
+            "max_ms": round(max(lags) * 1000, 2),
+        }
+
+# Create global loop lag monitor instance
+loop_monitor = LoopLagMonitor()
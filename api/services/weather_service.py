@@ -3,8 +3,9 @@ Weather service for fetching weather data
 """
 
 import asyncio
+import math
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from fastapi import HTTPException
 
 from api.models.weather import WeatherRequest, WeatherResponse
@@ -13,6 +14,8 @@ class WeatherService:
     """Service for handling weather data operations"""
     
     def __init__(self):
+        self._history_cache: Dict[Tuple[str, int], List[float]] = {}
+        
         # Mock weather data for demonstration
         # In production, this would be replaced with actual API calls
         self.mock_data = {
@@ -104,21 +107,13 @@ class WeatherService:
         # Simulate API delay
         await asyncio.sleep(0.3)
         
-        city_key = request.city.lower().strip()
-        
-        if city_key in self.mock_data:
-            data = self.mock_data[city_key]
-            return WeatherResponse(
-                city=request.city.title(),
-                country=request.country.upper(),
-                timestamp=datetime.now().isoformat(),
-                **data
-            )
-        else:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Weather data for '{request.city}' not found. Try: {', '.join(self.mock_data.keys())}"
-            )
+        data = self.get_readings(request.city)
+        return WeatherResponse(
+            city=request.city.title(),
+            country=request.country.upper(),
+            timestamp=datetime.now().isoformat(),
+            **data
+        )
     
     async def get_available_cities(self) -> Dict[str, Any]:
         """
@@ -133,6 +128,48 @@ class WeatherService:
             "timestamp": datetime.now().isoformat()
         }
     
+    def get_readings(self, city: str) -> Dict[str, Any]:
+        """
+        Get the current mock readings for a city
+        
+        Args:
+            city: City name
+            
+        Returns:
+            Dictionary of current weather readings
+            
+        Raises:
+            HTTPException: If city is not found
+        """
+        city_key = city.lower().strip()
+        
+        if city_key not in self.mock_data:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Weather data for '{city}' not found. Try: {', '.join(self.mock_data.keys())}"
+            )
+        return self.mock_data[city_key]
+    
+    def get_temperature_history(self, city: str, days: int) -> List[float]:
+        """
+        Get daily temperature history for a city (mock data)
+        
+        Args:
+            city: City name
+            days: Number of days of history, oldest first
+            
+        Returns:
+            List of daily temperatures in Celsius (shared, do not modify)
+        """
+        base = self.get_readings(city)["temperature"]
+        key = (city.lower().strip(), days)
+        if key not in self._history_cache:
+            # Deterministic day-to-day variation around the current temperature
+            self._history_cache[key] = [
+                round(base + 3.0 * math.sin(day * 0.9) - 0.1 * (days - day), 1) for day in range(days)
+            ]
+        return self._history_cache[key]
+    
     # TODO: Implement real weather API integration
     async def _fetch_from_api(self, city: str, country: str) -> Optional[Dict[str, Any]]:
         """
@@ -19,7 +19,15 @@ class Settings:
     # Weather API Configuration
     WEATHER_API_KEY: str = os.getenv("WEATHER_API_KEY", "")
     WEATHER_API_URL: str = os.getenv("WEATHER_API_URL", "https://api.openweathermap.org/data/2.5/weather")
-    
+
+    # Compute Configuration (derived metrics)
+    # "process": spawned worker processes (recommended)
+    # "thread": thread pool; only the NumPy math releases the GIL, JSON encoding does not
+    # "inline": on the event loop (benchmark baseline only)
+    COMPUTE_EXECUTOR: str = os.getenv("COMPUTE_EXECUTOR", "process")
+    COMPUTE_WORKERS: int = int(os.getenv("COMPUTE_WORKERS", str(os.cpu_count() or 2)))
+    COMPUTE_CHUNK_SIZE: int = int(os.getenv("COMPUTE_CHUNK_SIZE", "64"))
+
     # GUI Configuration
     WINDOW_TITLE: str = "Weather App"
     WINDOW_SIZE: str = "800x600"
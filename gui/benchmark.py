@@ -0,0 +1,191 @@
+"""
+Headless rendering benchmark for the weather display
+
+Feeds live-style updates for many cities into WeatherDisplay and reports
+frame time (duration of each redraw) and main-loop blocking (how late a
+fixed-interval timer fires). The window stays mapped, so frame time
+includes Tk redrawing the changed labels, not just the configure calls.
+
+Compare --mode coalesced against sync (diffing without after_idle
+coalescing) and naive (rebuilding widgets for every response). Needs a
+display tall enough for every row (24px each); on a headless machine run:
+
+    xvfb-run -s "-screen 0 1280x4000x24" python -m gui.benchmark --cities 150 --mode coalesced
+    xvfb-run -s "-screen 0 1280x4000x24" python -m gui.benchmark --cities 150 --mode sync
+    xvfb-run -s "-screen 0 1280x4000x24" python -m gui.benchmark --cities 150 --mode naive
+"""
+
+import argparse
+import random
+import statistics
+import time
+import tkinter as tk
+from datetime import datetime
+from typing import Dict, List
+
+from api.models.weather import WeatherResponse
+from api.services.loop_monitor import percentile
+from gui.components.weather_display import FIELDS, WeatherDisplay, city_key, format_weather_row
+from gui.styles.theme import AppTheme
+
+DESCRIPTIONS = ['Sunny', 'Partly cloudy', 'Overcast', 'Light rain', 'Clear sky', 'Hazy']
+
+class TimedWeatherDisplay(WeatherDisplay):
+    """WeatherDisplay that records how long each flush and the redraw it triggers take"""
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.frame_times: List[float] = []
+
+    def _flush(self):
+        start = time.perf_counter()
+        super()._flush()
+        self.update_idletasks()
+        self.frame_times.append(time.perf_counter() - start)
+
+class SyncWeatherDisplay(TimedWeatherDisplay):
+    """Diffs like WeatherDisplay but redraws inside every update_weather call"""
+
+    def update_weather(self, responses):
+        for weather in responses:
+            self._pending[city_key(weather)] = weather
+        self._flush()
+
+class NaiveWeatherDisplay(TimedWeatherDisplay):
+    """Baseline that rebuilds a city's widgets and redraws for every response"""
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self._grid_rows: Dict[str, int] = {}
+
+    def update_weather(self, responses):
+        for weather in responses:
+            start = time.perf_counter()
+            key = city_key(weather)
+            grid_row = self._grid_rows.setdefault(key, len(self._grid_rows))
+            for label in self._rows.pop(key, {}).values():
+                label.destroy()
+
+            self._next_row = grid_row
+            row = self._create_row(key)
+            for index, field in enumerate(FIELDS):
+                row[field].configure(text=format_weather_row(weather)[index])
+            self.update_idletasks()
+            self.frame_times.append(time.perf_counter() - start)
+
+DISPLAYS = {
+    'coalesced': TimedWeatherDisplay,
+    'sync': SyncWeatherDisplay,
+    'naive': NaiveWeatherDisplay
+}
+
+def make_cities(count: int) -> Dict[str, WeatherResponse]:
+    """Create initial weather data for a number of synthetic cities"""
+    now = datetime.now().isoformat()
+    cities = {}
+    for i in range(count):
+        weather = WeatherResponse(
+            city=f"City {i:03d}",
+            country="US",
+            temperature=round(random.uniform(-5, 35), 1),
+            description=random.choice(DESCRIPTIONS),
+            humidity=random.randint(20, 95),
+            wind_speed=round(random.uniform(0, 30), 1),
+            pressure=random.randint(990, 1030),
+            feels_like=round(random.uniform(-5, 35), 1),
+            visibility=random.randint(1, 15),
+            uv_index=round(random.uniform(0, 11), 1),
+            timestamp=now
+        )
+        cities[city_key(weather)] = weather
+    return cities
+
+def run(cities: int, rounds: int, interval_ms: int, change_ratio: float, mode: str) -> Dict[str, float]:
+    """
+    Run the benchmark
+
+    Args:
+        cities: Number of cities shown
+        rounds: Number of update rounds
+        interval_ms: Delay between update rounds
+        change_ratio: Fraction of cities whose data changes each round
+        mode: "coalesced" (WeatherDisplay), "sync" (diff but redraw on every
+            update_weather call) or "naive" (rebuild and redraw per response)
+
+    Returns:
+        Dictionary of timing statistics in milliseconds
+    """
+    random.seed(0)
+    root = tk.Tk()
+    # Keep the window mapped so labels are actually drawn: Tk skips
+    # redisplay for unmapped widgets and frame time would only count
+    # the configure calls
+    root.geometry(f"{AppTheme.WINDOW['width']}x{cities * 24}")
+
+    display = DISPLAYS[mode](root)
+    display.pack(fill=tk.BOTH, expand=True)
+    data = make_cities(cities)
+    display.update_weather(data.values())
+    root.update()
+    initial_frames = len(display.frame_times)
+
+    tick_ms = 5
+    lags: List[float] = []
+    state = {'round': 0, 'last_tick': time.perf_counter()}
+
+    def tick():
+        now = time.perf_counter()
+        lags.append(max(now - state['last_tick'] - tick_ms / 1000, 0.0))
+        state['last_tick'] = now
+        root.after(tick_ms, tick)
+
+    def feed():
+        if state['round'] >= rounds:
+            root.after(interval_ms, root.quit)
+            return
+        # Responses arrive in several small batches; they should coalesce
+        changed = random.sample(list(data), max(1, int(cities * change_ratio)))
+        for key in changed:
+            data[key] = data[key].copy(update={
+                'temperature': round(data[key].temperature + random.uniform(-1, 1), 1),
+                'humidity': random.randint(20, 95)
+            })
+        for start in range(0, len(changed), 10):
+            display.update_weather(data[key] for key in changed[start:start + 10])
+        state['round'] += 1
+        root.after(interval_ms, feed)
+
+    root.after(tick_ms, tick)
+    root.after(interval_ms, feed)
+    root.mainloop()
+    root.destroy()
+
+    frames = display.frame_times[initial_frames:]  # skip initial row creation
+    return {
+        'frames': len(frames),
+        'frame_mean_ms': statistics.mean(frames) * 1000 if frames else 0.0,
+        'frame_p95_ms': percentile(frames, 0.95) * 1000,
+        'frame_max_ms': max(frames, default=0.0) * 1000,
+        'loop_lag_p95_ms': percentile(lags, 0.95) * 1000,
+        'loop_lag_max_ms': max(lags, default=0.0) * 1000
+    }
+
+def main():
+    """Parse arguments and print benchmark results"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cities', type=int, default=150)
+    parser.add_argument('--rounds', type=int, default=200)
+    parser.add_argument('--interval-ms', type=int, default=16)
+    parser.add_argument('--change-ratio', type=float, default=0.1)
+    parser.add_argument('--mode', choices=list(DISPLAYS), default='coalesced',
+                        help='coalesced: diff + after_idle; sync: diff, redraw per call; '
+                             'naive: rebuild and redraw per response')
+    args = parser.parse_args()
+
+    results = run(args.cities, args.rounds, args.interval_ms, args.change_ratio, args.mode)
+    print(f"{args.mode}: {args.cities} cities, {args.rounds} rounds")
+    for name, value in results.items():
+        print(f"  {name:>16}: {value:.2f}" if isinstance(value, float) else f"  {name:>16}: {value}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Weather display component
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, Iterable, Optional, Tuple
+
+from api.models.weather import WeatherResponse
+from gui.styles.theme import AppTheme, apply_window_icon, configure_styles, get_weather_icon
+
+# Label columns of each city row, in display order
+FIELDS = ('icon', 'city', 'temperature', 'description', 'humidity', 'wind')
+
+FIELD_STYLES = {
+    'icon': 'Info.TLabel',
+    'city': 'Info.TLabel',
+    'temperature': 'Info.TLabel',
+    'description': 'Small.TLabel',
+    'humidity': 'Small.TLabel',
+    'wind': 'Small.TLabel'
+}
+
+def city_key(weather: WeatherResponse) -> str:
+    """
+    Get the key identifying a city row
+
+    Args:
+        weather: WeatherResponse object
+
+    Returns:
+        Normalized "city,country" key
+    """
+    return f"{weather.city.lower().strip()},{weather.country.upper()}"
+
+def format_weather_row(weather: WeatherResponse) -> Tuple[str, ...]:
+    """
+    Format the label texts for a city row
+
+    Args:
+        weather: WeatherResponse object
+
+    Returns:
+        Tuple of label texts, one per entry in FIELDS
+    """
+    return (
+        get_weather_icon(weather.description),
+        f"{weather.city}, {weather.country}",
+        f"{weather.temperature:.1f}°C",
+        weather.description,
+        f"💧 {weather.humidity}%",
+        f"💨 {weather.wind_speed:.1f} km/h"
+    )
+
+class WeatherDisplay(ttk.Frame):
+    """
+    Table of weather rows, one per city
+
+    Incoming data is diffed against what is on screen: only labels whose
+    text changed are reconfigured, and all updates received before the
+    next idle point are coalesced into a single flush.
+    """
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        configure_styles(ttk.Style(self))
+        apply_window_icon(self)
+
+        self._rows: Dict[str, Dict[str, ttk.Label]] = {}
+        self._rendered: Dict[str, Tuple[str, ...]] = {}
+        self._pending: Dict[str, WeatherResponse] = {}
+        self._flush_id: Optional[str] = None
+        self._next_row = 0
+
+    def update_weather(self, responses: Iterable[WeatherResponse]):
+        """
+        Queue weather data for display
+
+        Args:
+            responses: WeatherResponse objects; the latest one per city wins
+        """
+        for weather in responses:
+            self._pending[city_key(weather)] = weather
+        if self._pending and self._flush_id is None:
+            self._flush_id = self.after_idle(self._flush)
+
+    def remove_city(self, key: str):
+        """
+        Remove a city row
+
+        Args:
+            key: Row key as returned by city_key
+        """
+        self._pending.pop(key, None)
+        self._rendered.pop(key, None)
+        for label in self._rows.pop(key, {}).values():
+            label.destroy()
+
+    def destroy(self):
+        """Cancel any scheduled flush before destroying the widget"""
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+            self._flush_id = None
+        super().destroy()
+
+    def _create_row(self, key: str) -> Dict[str, ttk.Label]:
+        """Create the labels for a new city row"""
+        row = {}
+        for column, field in enumerate(FIELDS):
+            label = ttk.Label(self, style=FIELD_STYLES[field])
+            label.grid(row=self._next_row, column=column, sticky=tk.W,
+                       padx=AppTheme.SPACING['small'], pady=1)
+            row[field] = label
+        self._rows[key] = row
+        self._next_row += 1
+        return row
+
+    def _flush(self):
+        """Apply pending updates, touching only labels whose text changed"""
+        self._flush_id = None
+        pending, self._pending = self._pending, {}
+
+        for key, weather in pending.items():
+            texts = format_weather_row(weather)
+            previous = self._rendered.get(key)
+            if texts == previous:
+                continue
+
+            row = self._rows.get(key) or self._create_row(key)
+            for index, field in enumerate(FIELDS):
+                if previous is None or previous[index] != texts[index]:
+                    row[field].configure(text=texts[index])
+            self._rendered[key] = texts
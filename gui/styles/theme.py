@@ -2,9 +2,20 @@
 Theme configuration for the GUI application
 """
 
+import os
+import weakref
 import tkinter as tk
+from functools import lru_cache
+from tkinter import font as tkfont
 from tkinter import ttk
 
+# Application icon shipped in assets/
+ICON_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                         'assets', 'icons', 'weather_icon.png')
+
+# Styles, fonts and icons are configured once per Tk root and reused
+_root_assets = weakref.WeakKeyDictionary()
+
 class AppTheme:
     """Application theme configuration"""
     
@@ -48,51 +59,102 @@ class AppTheme:
         'resizable': True
     }
 
+def _assets_for(widget) -> dict:
+    """Get the asset cache for the Tk root owning a widget"""
+    return _root_assets.setdefault(widget._root(), {})
+
+def get_font(widget, name: str) -> tkfont.Font:
+    """
+    Get a named theme font, created once per Tk root
+    
+    Args:
+        widget: Any widget of the target Tk root
+        name: Key in AppTheme.FONTS
+        
+    Returns:
+        Shared Font instance
+    """
+    fonts = _assets_for(widget).setdefault('fonts', {})
+    if name not in fonts:
+        fonts[name] = tkfont.Font(root=widget._root(), font=AppTheme.FONTS[name])
+    return fonts[name]
+
+def apply_window_icon(widget) -> bool:
+    """
+    Set the application icon as default for all windows, once per Tk root
+    
+    Args:
+        widget: Any widget of the target Tk root
+        
+    Returns:
+        True if the icon could be loaded
+    """
+    assets = _assets_for(widget)
+    if 'icon' not in assets:
+        root = widget._root()
+        try:
+            # PNG via PhotoImage works on X11, macOS and Windows alike
+            image = tk.PhotoImage(master=root, file=ICON_PATH)
+            root.iconphoto(True, image)
+        except tk.TclError:
+            image = None
+        # Keep a reference: Tk drops the icon once the PhotoImage is collected
+        assets['icon'] = image
+    return assets['icon'] is not None
+
 def configure_styles(style: ttk.Style):
     """
     Configure custom styles for the application
     
+    Safe to call repeatedly: styles are only built on the first call
+    for each Tk root.
+    
     Args:
         style: ttk.Style instance
     """
+    assets = _assets_for(style.master)
+    if assets.get('styles'):
+        return
+    
     theme = AppTheme()
+    fonts = {name: get_font(style.master, name) for name in theme.FONTS}
     
     # Configure theme
     style.theme_use('clam')
     
     # Title label
     style.configure('Title.TLabel',
-                   font=theme.FONTS['title'],
+                   font=fonts['title'],
                    foreground=theme.COLORS['white'],
                    background=theme.COLORS['primary'])
     
     # Header label
     style.configure('Header.TLabel',
-                   font=theme.FONTS['header'],
+                   font=fonts['header'],
                    foreground=theme.COLORS['accent'],
                    background=theme.COLORS['primary'])
     
     # Body text label
     style.configure('Body.TLabel',
-                   font=theme.FONTS['body'],
+                   font=fonts['body'],
                    foreground=theme.COLORS['light'],
                    background=theme.COLORS['primary'])
     
     # Info label
     style.configure('Info.TLabel',
-                   font=theme.FONTS['body'],
+                   font=fonts['body'],
                    foreground=theme.COLORS['light'],
                    background=theme.COLORS['secondary'])
     
     # Temperature label
     style.configure('Temperature.TLabel',
-                   font=theme.FONTS['temperature'],
+                   font=fonts['temperature'],
                    foreground=theme.COLORS['danger'],
                    background=theme.COLORS['secondary'])
     
     # Search entry
     style.configure('Search.TEntry',
-                   font=theme.FONTS['search'],
+                   font=fonts['search'],
                    fieldbackground=theme.COLORS['secondary'],
                    foreground=theme.COLORS['white'],
                    borderwidth=1,
@@ -101,7 +163,7 @@ def configure_styles(style: ttk.Style):
     
     # Search button
     style.configure('Search.TButton',
-                   font=theme.FONTS['body'],
+                   font=fonts['body'],
                    background=theme.COLORS['accent'],
                    foreground=theme.COLORS['white'],
                    borderwidth=0,
@@ -114,27 +176,29 @@ def configure_styles(style: ttk.Style):
     
     # Loading label
     style.configure('Loading.TLabel',
-                   font=theme.FONTS['header'],
+                   font=fonts['header'],
                    foreground=theme.COLORS['warning'],
                    background=theme.COLORS['secondary'])
     
     # Error label
     style.configure('Error.TLabel',
-                   font=theme.FONTS['body'],
+                   font=fonts['body'],
                    foreground=theme.COLORS['danger'],
                    background=theme.COLORS['secondary'])
     
     # Success label
     style.configure('Success.TLabel',
-                   font=theme.FONTS['body'],
+                   font=fonts['body'],
                    foreground=theme.COLORS['success'],
                    background=theme.COLORS['secondary'])
     
     # Small text label
     style.configure('Small.TLabel',
-                   font=theme.FONTS['small'],
+                   font=fonts['small'],
                    foreground=theme.COLORS['light'],
                    background=theme.COLORS['secondary'])
+    
+    assets['styles'] = True
 
 def create_gradient_frame(parent, color1, color2, height=2):
     """
@@ -152,6 +216,7 @@ def create_gradient_frame(parent, color1, color2, height=2):
     frame = tk.Frame(parent, bg=color1, height=height)
     return frame
 
+@lru_cache(maxsize=256)
 def get_weather_icon(description: str) -> str:
     """
     Get weather icon based on description
@@ -192,4 +257,15 @@ def get_color_by_temperature(temp: float) -> str:
     Get color based on temperature
     
     Args:
-        temp: Temperature in
\ No newline at end of file
+        temp: Temperature in Celsius
+        
+    Returns:
+        Hex color string
+    """
+    if temp >= 30:
+        return AppTheme.COLORS['danger']
+    if temp >= 20:
+        return AppTheme.COLORS['warning']
+    if temp >= 10:
+        return AppTheme.COLORS['success']
+    return AppTheme.COLORS['accent']
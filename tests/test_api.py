@@ -0,0 +1,180 @@
+"""
+Tests for the weather API
+"""
+
+import asyncio
+import json
+import time
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.models.weather import DerivedMetrics
+from api.services import compute_service as compute_module
+from api.services.compute_service import (
+    ComputeService, comfort_score, dew_point, heat_index, render_chunk, smooth_history
+)
+from api.services.loop_monitor import LoopLagMonitor, percentile
+from api.services.weather_service import weather_service
+
+EXECUTORS = ["process", "thread", "inline"]
+
+def test_dew_point_saturated_air_equals_temperature():
+    t = np.array([-5.0, 10.0, 30.0])
+    assert np.allclose(dew_point(t, np.full(3, 100.0)), t)
+
+def test_dew_point_known_value():
+    # 25°C at 60% RH has a dew point of about 16.7°C
+    assert dew_point(np.array([25.0]), np.array([60.0]))[0] == pytest.approx(16.7, abs=0.1)
+
+def test_dew_point_clips_zero_humidity():
+    assert np.isfinite(dew_point(np.array([20.0]), np.array([0.0]))).all()
+
+def test_heat_index_uses_simple_formula_when_mild():
+    # 20°C (68°F) at 50% RH is below the regression threshold: 66.85°F
+    assert heat_index(np.array([20.0]), np.array([50.0]))[0] == pytest.approx(19.36, abs=0.01)
+
+def test_heat_index_uses_regression_when_hot():
+    # NWS table: 90°F at 70% RH feels like 106°F (41.1°C)
+    assert heat_index(np.array([32.22]), np.array([70.0]))[0] == pytest.approx(41.1, abs=0.5)
+
+def test_comfort_score_ideal_and_clipped():
+    scores = comfort_score(np.array([21.0, 50.0]), np.array([45.0, 100.0]), np.array([5.0, 80.0]))
+    assert scores.tolist() == [100.0, 0.0]
+
+def test_comfort_score_penalizes_only_strong_wind():
+    calm = comfort_score(np.array([21.0]), np.array([45.0]), np.array([20.0]))
+    windy = comfort_score(np.array([21.0]), np.array([45.0]), np.array([30.0]))
+    assert calm[0] == 100.0
+    assert windy[0] == pytest.approx(96.0)
+
+def test_smooth_history_moving_average():
+    history = np.array([[1.0, 2.0, 3.0, 4.0], [10.0, 10.0, 10.0, 10.0]])
+    assert smooth_history(history, 2).tolist() == [[1.5, 2.5, 3.5], [10.0, 10.0, 10.0]]
+
+def test_smooth_history_clamps_window_to_days():
+    history = np.array([[1.0, 2.0, 3.0]])
+    assert smooth_history(history, 10).tolist() == [[2.0]]
+
+def test_render_chunk_matches_derived_metrics_schema():
+    history = [weather_service.get_temperature_history("london", 10)] * 2
+    line = render_chunk(3, ["london", "new york"], "GB", [18.3, 35.0], [78, 60], [8.2, 25.0], history, 4)
+
+    assert line.endswith("\n")
+    chunk = json.loads(line)
+    assert chunk["chunk"] == 3
+    for result in chunk["results"]:
+        assert DerivedMetrics(**result).dict() == result
+    assert [r["city"] for r in chunk["results"]] == ["London", "New York"]
+    assert {r["country"] for r in chunk["results"]} == {"GB"}
+
+def test_compute_service_rejects_unknown_executor():
+    with pytest.raises(ValueError):
+        ComputeService(executor="proces")
+
+def _collect(service, cities, window=3):
+    readings = [weather_service.get_readings(city) for city in cities]
+    history = [weather_service.get_temperature_history(city, 7) for city in cities]
+
+    async def run():
+        try:
+            return [chunk async for chunk in service.stream_derived(cities, "US", readings, history, window)]
+        finally:
+            service.shutdown()
+
+    return [json.loads(line) for line in asyncio.run(run())]
+
+@pytest.mark.parametrize("executor", EXECUTORS)
+def test_stream_derived_chunk_order_and_size(executor):
+    cities = ["london", "tokyo", "paris", "delhi", "sydney"] * 5
+    service = ComputeService(executor=executor, workers=2, chunk_size=4)
+
+    chunks = _collect(service, cities)
+
+    assert [chunk["chunk"] for chunk in chunks] == list(range(7))
+    assert [len(chunk["results"]) for chunk in chunks] == [4, 4, 4, 4, 4, 4, 1]
+    results = [m for chunk in chunks for m in chunk["results"]]
+    assert [m["city"] for m in results] == [city.title() for city in cities]
+    assert all(len(m["smoothed_forecast"]) == 5 for m in results)
+
+@pytest.mark.parametrize("executor", EXECUTORS)
+def test_stream_derived_results_match_across_executors(executor):
+    expected = _collect(ComputeService(executor="inline", chunk_size=2), ["mumbai", "london", "tokyo"])
+    actual = _collect(ComputeService(executor=executor, workers=2, chunk_size=2), ["mumbai", "london", "tokyo"])
+    assert actual == expected
+
+def test_derived_endpoint_streams_chunks():
+    with TestClient(app) as client:
+        response = client.post("/api/v1/derived", json={"cities": ["london", "tokyo"] * 40, "country": "gb"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["chunk"] for line in lines] == [0, 1]
+    assert sum(len(line["results"]) for line in lines) == 80
+    assert {r["country"] for line in lines for r in line["results"]} == {"GB"}
+
+def test_derived_endpoint_unknown_city_is_404_before_streaming():
+    with TestClient(app) as client:
+        response = client.post("/api/v1/derived", json={"cities": ["london", "atlantis"]})
+
+    assert response.status_code == 404
+    assert "atlantis" in response.json()["error"]
+
+def test_derived_endpoint_reports_worker_failure_in_stream(monkeypatch):
+    def fail(*args):
+        raise RuntimeError("worker died")
+
+    # The inline executor resolves compute_chunk from the module
+    monkeypatch.setattr(compute_module, "compute_chunk", fail)
+    monkeypatch.setattr(compute_module.compute_service, "executor_kind", "inline")
+    with TestClient(app) as client:
+        response = client.post("/api/v1/derived", json={"cities": ["london"]})
+
+    assert response.status_code == 200
+    last = json.loads(response.text.splitlines()[-1])
+    assert last["error"] == "Derived metrics computation failed"
+    assert "worker died" in last["detail"]
+
+def test_percentile_nearest_rank():
+    values = [5.0, 1.0, 4.0, 2.0, 3.0]
+    assert percentile(values, 0.0) == 1.0
+    assert percentile(values, 0.5) == 3.0
+    assert percentile(values, 0.99) == 5.0
+    assert percentile([], 0.99) == 0.0
+
+def test_loop_lag_monitor_snapshot_empty():
+    assert LoopLagMonitor().snapshot() == {"samples": 0, "mean_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+
+def test_loop_lag_monitor_snapshot_stats():
+    monitor = LoopLagMonitor()
+    monitor._lags.extend([0.001] * 99 + [0.5])
+
+    stats = monitor.snapshot()
+
+    assert stats["samples"] == 100
+    assert stats["mean_ms"] == pytest.approx(5.99)
+    assert stats["p99_ms"] == 500.0
+    assert stats["max_ms"] == 500.0
+
+def test_loop_lag_monitor_detects_blocking():
+    monitor = LoopLagMonitor(interval=0.01)
+
+    async def run():
+        monitor.start()
+        await asyncio.sleep(0.05)
+        time.sleep(0.1)  # block the loop
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+    asyncio.run(run())
+    assert monitor.snapshot()["max_ms"] >= 80
+
+def test_loop_lag_endpoint_reset():
+    with TestClient(app) as client:
+        client.get("/api/v1/metrics/loop-lag", params={"reset": True})
+        stats = client.get("/api/v1/metrics/loop-lag").json()
+
+    assert set(stats) == {"samples", "mean_ms", "p99_ms", "max_ms", "timestamp"}
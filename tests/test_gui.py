@@ -0,0 +1,283 @@
+"""
+Tests for the GUI
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+import pytest
+
+from api.models.weather import WeatherResponse
+from gui.components.weather_display import FIELDS, WeatherDisplay, city_key, format_weather_row
+from gui.styles.theme import (
+    ICON_PATH, AppTheme, apply_window_icon, configure_styles, get_color_by_temperature, get_weather_icon
+)
+
+def make_weather(**overrides) -> WeatherResponse:
+    data = {
+        "city": "London",
+        "country": "GB",
+        "temperature": 18.34,
+        "description": "Light rain",
+        "humidity": 78,
+        "wind_speed": 8.2,
+        "pressure": 1008,
+        "feels_like": 16.5,
+        "visibility": 8,
+        "uv_index": 3.1,
+        "timestamp": "2024-01-15T14:30:00"
+    }
+    data.update(overrides)
+    return WeatherResponse(**data)
+
+@pytest.fixture
+def root():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display available")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+def test_city_key_normalizes_city_and_country():
+    assert city_key(make_weather(city=" London ", country="gb")) == "london,GB"
+    assert city_key(make_weather(city="LONDON")) == city_key(make_weather(city="london"))
+
+def test_format_weather_row():
+    row = format_weather_row(make_weather())
+    assert len(row) == len(FIELDS)
+    assert row == ("🌦️", "London, GB", "18.3°C", "Light rain", "💧 78%", "💨 8.2 km/h")
+
+def test_format_weather_row_ignores_unshown_fields():
+    assert format_weather_row(make_weather(pressure=990)) == format_weather_row(make_weather())
+
+@pytest.mark.parametrize("temp, color", [
+    (35.0, "danger"),
+    (30.0, "danger"),
+    (25.0, "warning"),
+    (20.0, "warning"),
+    (15.0, "success"),
+    (10.0, "success"),
+    (9.9, "accent"),
+    (-10.0, "accent"),
+])
+def test_get_color_by_temperature(temp, color):
+    assert get_color_by_temperature(temp) == AppTheme.COLORS[color]
+
+def test_get_weather_icon_default():
+    assert get_weather_icon("Hot and humid") == "🌤️"
+
+def test_icon_asset_is_a_png():
+    with open(ICON_PATH, 'rb') as f:
+        assert f.read(8) == b'\x89PNG\r\n\x1a\n'
+
+def test_apply_window_icon_loads_once_per_root(root, monkeypatch):
+    assert apply_window_icon(root) is True
+
+    def fail(*args, **kwargs):
+        raise AssertionError("icon loaded twice")
+
+    monkeypatch.setattr(tk, "PhotoImage", fail)
+    assert apply_window_icon(root) is True
+
+def _count_configure_calls(monkeypatch):
+    # Patch the class so every Style instance is counted
+    calls = []
+    original = ttk.Style.configure
+
+    def configure(self, *args, **kwargs):
+        calls.append(args)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ttk.Style, "configure", configure)
+    return calls
+
+def test_configure_styles_runs_once_per_root(root, monkeypatch):
+    calls = _count_configure_calls(monkeypatch)
+
+    configure_styles(ttk.Style(root))
+    first = len(calls)
+    configure_styles(ttk.Style(root))
+    WeatherDisplay(root)
+
+    assert first > 0
+    assert len(calls) == first
+
+def test_configure_styles_runs_again_for_new_root(root, monkeypatch):
+    configure_styles(ttk.Style(root))
+    calls = _count_configure_calls(monkeypatch)
+    other = tk.Tk()
+    try:
+        other.withdraw()
+        configure_styles(ttk.Style(other))
+        assert len(calls) > 0
+    finally:
+        other.destroy()
+
+class RecordingLabel:
+    """Stand-in for ttk.Label that records configure calls"""
+
+    def __init__(self):
+        self.text = ""
+        self.configured = 0
+        self.destroyed = False
+
+    def configure(self, text):
+        self.text = text
+        self.configured += 1
+
+    def destroy(self):
+        self.destroyed = True
+
+@pytest.fixture
+def headless_display():
+    """
+    WeatherDisplay without a Tk interpreter
+
+    Rows are RecordingLabels and after_idle only queues the callback, so
+    the diffing and coalescing logic runs without a display.
+    """
+    display = WeatherDisplay.__new__(WeatherDisplay)
+    display._rows = {}
+    display._rendered = {}
+    display._pending = {}
+    display._flush_id = None
+    display._next_row = 0
+    display.idle = []
+
+    def after_idle(callback):
+        display.idle.append(callback)
+        return f"after#{len(display.idle)}"
+
+    def create_row(key):
+        display._rows[key] = {field: RecordingLabel() for field in FIELDS}
+        return display._rows[key]
+
+    display.after_idle = after_idle
+    display._create_row = create_row
+    return display
+
+def _run_idle(display):
+    callbacks, display.idle = display.idle, []
+    for callback in callbacks:
+        callback()
+
+def test_headless_update_weather_schedules_a_single_flush(headless_display):
+    headless_display.update_weather([make_weather(city="London")])
+    headless_display.update_weather([make_weather(city="Paris", country="FR")])
+    headless_display.update_weather([make_weather(city="London", temperature=5.0)])
+
+    assert len(headless_display.idle) == 1
+    assert headless_display._rows == {}
+
+    _run_idle(headless_display)
+
+    assert headless_display._flush_id is None
+    assert set(headless_display._rows) == {"london,GB", "paris,FR"}
+    assert headless_display._rows["london,GB"]["temperature"].text == "5.0°C"
+
+def test_headless_flush_only_touches_changed_labels(headless_display):
+    headless_display.update_weather([make_weather()])
+    _run_idle(headless_display)
+    row = headless_display._rows["london,GB"]
+    assert all(label.configured == 1 for label in row.values())
+
+    headless_display.update_weather([make_weather(temperature=21.0, humidity=50)])
+    _run_idle(headless_display)
+
+    assert {field: label.configured for field, label in row.items()} == {
+        'icon': 1, 'city': 1, 'temperature': 2, 'description': 1, 'humidity': 2, 'wind': 1
+    }
+    assert tuple(row[field].text for field in FIELDS) == format_weather_row(
+        make_weather(temperature=21.0, humidity=50)
+    )
+
+def test_headless_unchanged_data_touches_nothing(headless_display):
+    headless_display.update_weather([make_weather()])
+    _run_idle(headless_display)
+
+    # Fields that are not displayed don't count as changes either
+    headless_display.update_weather([make_weather(pressure=990, timestamp="2024-01-16T00:00:00")])
+    _run_idle(headless_display)
+
+    assert all(label.configured == 1 for label in headless_display._rows["london,GB"].values())
+
+def test_headless_empty_update_schedules_nothing(headless_display):
+    headless_display.update_weather([])
+    assert headless_display.idle == []
+
+def test_headless_remove_city(headless_display):
+    headless_display.update_weather([make_weather()])
+    _run_idle(headless_display)
+    row = headless_display._rows["london,GB"]
+
+    headless_display.update_weather([make_weather(temperature=30.0)])
+    headless_display.remove_city("london,GB")
+    _run_idle(headless_display)
+
+    assert all(label.destroyed for label in row.values())
+    assert headless_display._rows == {}
+    assert headless_display._rendered == {}
+
+def _label_texts(display, key):
+    return tuple(display._rows[key][field].cget("text") for field in FIELDS)
+
+def test_flush_only_touches_changed_labels(root, monkeypatch):
+    display = WeatherDisplay(root)
+    weather = make_weather()
+    key = city_key(weather)
+    display.update_weather([weather])
+    root.update_idletasks()
+
+    configured = []
+    for field, label in display._rows[key].items():
+        original = label.configure
+        monkeypatch.setattr(label, "configure",
+                            lambda *args, _field=field, _original=original, **kwargs:
+                            (configured.append(_field), _original(*args, **kwargs)))
+
+    display.update_weather([make_weather(temperature=21.0)])
+    root.update_idletasks()
+
+    assert configured == ["temperature"]
+    assert _label_texts(display, key) == format_weather_row(make_weather(temperature=21.0))
+
+    configured.clear()
+    display.update_weather([make_weather(temperature=21.0)])
+    root.update_idletasks()
+    assert configured == []
+
+def test_update_weather_coalesces_into_one_flush(root, monkeypatch):
+    display = WeatherDisplay(root)
+    flushes = []
+    original = display._flush
+    monkeypatch.setattr(display, "_flush", lambda: (flushes.append(1), original()))
+
+    display.update_weather([make_weather(city="London")])
+    display.update_weather([make_weather(city="Paris", country="FR")])
+    display.update_weather([make_weather(city="London", temperature=5.0)])
+    assert flushes == []
+
+    root.update_idletasks()
+
+    assert flushes == [1]
+    assert set(display._rows) == {"london,GB", "paris,FR"}
+    assert _label_texts(display, "london,GB")[2] == "5.0°C"
+
+def test_remove_city_and_destroy_cancel_pending(root, monkeypatch):
+    display = WeatherDisplay(root)
+    display.update_weather([make_weather()])
+    root.update_idletasks()
+    display.remove_city("london,GB")
+    assert display._rows == {}
+
+    flushes = []
+    monkeypatch.setattr(display, "_flush", lambda: flushes.append(1))
+    display.update_weather([make_weather()])
+    assert display._flush_id is not None
+    display.destroy()
+    root.update_idletasks()
+
+    assert display._flush_id is None
+    assert flushes == []